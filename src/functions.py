@@ -1,39 +1,154 @@
 import argparse
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 
+import py7zr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.variables import (
+    ARCHIVE_SUFFIXES,
+    CACHE_DIR,
     CONFIG_EMU_EXE,
+    COPY_BUFSIZE,
+    DOWNLOAD_CHUNK_SIZE,
     DOWNLOAD_DIR,
+    EMU_ARCHIVE_MEMBERS,
     EMU_PATH,
     EMU_REPO,
+    EMU_TOOLS_ARCHIVE_MEMBERS,
     EMU_TOOLS_PATH,
     GITHUB_API_BASE,
+    GITHUB_TOKEN,
     INTERFACES_EMU_EXE,
-    SEVENZR_EXE,
-    SEVENZR_URL,
+    RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_MIN_REMAINING,
+    RELEASE_CACHE_TTL,
     STEAMLESS_REPO,
     TOOLS_DIR,
     TOOLS_REPO,
 )
 
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+# Time (epoch seconds) the GitHub API rate limit resets, once it runs low
+_rate_limit_reset = 0.0
+
+# Directories holding cracked or original copies of the game files
+_SKIP_DIR_RE = re.compile(r"crack|original", re.IGNORECASE)
+# Steam AppIDs are plain ASCII numbers (str.isdigit also accepts e.g. "²")
+_APPID_RE = re.compile(r"[0-9]+")
+
+
+def _wait_for_rate_limit():
+    """Sleeps until the GitHub API rate limit resets if it is nearly used up."""
+    wait = _rate_limit_reset - time.time()
+    if wait <= 0:
+        return
+    if wait > RATE_LIMIT_MAX_WAIT:
+        logging.warning(
+            f"GitHub API rate limit nearly exhausted, resets in {wait:.0f}s. "
+            "Set GITHUB_TOKEN to raise the limit."
+        )
+        return
+    logging.info(f"GitHub API rate limit nearly exhausted, waiting {wait:.0f}s")
+    time.sleep(wait)
+
+
+def _track_rate_limit(response: requests.Response):
+    """Remembers when the rate limit resets if few API calls remain."""
+    global _rate_limit_reset
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining and reset and int(remaining) < RATE_LIMIT_MIN_REMAINING:
+        _rate_limit_reset = float(reset)
+
+
+def _release_cache_path(repo: str) -> Path:
+    return CACHE_DIR / f"{repo.replace('/', '_')}.json"
+
+
+@functools.lru_cache(maxsize=32)  # Shared per process, callers must not mutate it
+def fetch_latest_release(repo: str) -> dict:
+    """Fetches the latest GitHub release of repo via an ETag-validated disk cache."""
+    cache_path = _release_cache_path(repo)
+    cached = None
+    if cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text())
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable release cache {cache_path}: {e}")
+    if not isinstance(cached, dict) or "assets" not in cached:
+        cached = None  # Unreadable or written by an older version
+
+    if cached and time.time() - cache_path.stat().st_mtime < RELEASE_CACHE_TTL:
+        logging.info(f"Using cached release info for {repo}")
+        return cached
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if GITHUB_TOKEN:
+        # Authenticated requests get a far higher API rate limit
+        headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    api_url = f"{GITHUB_API_BASE}/{repo}/releases/latest"
+    _wait_for_rate_limit()
+    response = SESSION.get(api_url, headers=headers, timeout=30)
+    _track_rate_limit(response)
+    if cached and response.status_code == 304:
+        logging.info(f"Release info for {repo} unchanged, using cache")
+        cache_path.touch()
+        return cached
+    response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+
+    release_data = {
+        "etag": response.headers.get("ETag"),
+        "assets": [
+            {
+                "name": asset.get("name", ""),
+                "browser_download_url": asset.get("browser_download_url"),
+            }
+            for asset in response.json().get("assets", [])
+        ],
+    }
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(release_data))
+    return release_data
+
 
 def get_latest_release_asset_url(
     repo: str, asset_name_filter: str | None = None, asset_exact_name: str | None = None
 ) -> str | None:
     """Fetches the download URL for a specific asset from the latest GitHub release."""
-    api_url = f"{GITHUB_API_BASE}/{repo}/releases/latest"
     try:
-        response = requests.get(api_url, timeout=30)
-        response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-        release_data = response.json()
+        release_data = fetch_latest_release(repo)
         assets = release_data.get("assets", [])
 
         if not assets:
@@ -42,88 +157,193 @@ def get_latest_release_asset_url(
 
         for asset in assets:
             asset_name = asset.get("name", "")
-            if asset_exact_name and asset_name == asset_exact_name:
-                logging.info(f"Found exact match asset '{asset_name}' for {repo}")
-                return asset.get("browser_download_url")
-            elif (
-                asset_name_filter
-                and asset_name_filter in asset_name
-                and asset_name.endswith((".zip", ".7z"))
-            ):
-                # Prioritize zip if multiple matches containing filter exist and no exact match specified
-                # Or just return the first match if only filter is used
-                logging.info(
-                    f"Found filtered asset '{asset_name}' for {repo} using filter '{asset_name_filter}'"
-                )
-                # Simple logic: return the first match found containing the filter
-                # More complex logic could be added here if needed (e.g. prefer .zip)
+            if asset_exact_name:
+                if asset_name == asset_exact_name:
+                    logging.info(f"Found exact match asset '{asset_name}' for {repo}")
+                    return asset.get("browser_download_url")
+            elif not asset_name.endswith(ARCHIVE_SUFFIXES):
+                continue
+            elif asset_name_filter:
+                # Simple logic: return the first archive containing the filter
+                if asset_name_filter in asset_name:
+                    logging.info(
+                        f"Found filtered asset '{asset_name}' for {repo} using filter '{asset_name_filter}'"
+                    )
+                    return asset.get("browser_download_url")
+            else:
+                # No filter/name provided, take the first zip or 7z
+                logging.info(f"Found generic archive asset '{asset_name}' for {repo}")
                 return asset.get("browser_download_url")
 
-        # If only a filter was provided and no match found after checking all
-        if asset_name_filter and not asset_exact_name:
+        if asset_exact_name:
             logging.error(
-                f"No asset containing '{asset_name_filter}' found in the latest release for {repo}"
+                f"Asset '{asset_exact_name}' not found in the latest release for {repo}"
             )
-            return None
-        # If exact name was provided and not found
-        elif asset_exact_name:
+        elif asset_name_filter:
             logging.error(
-                f"Asset '{asset_exact_name}' not found in the latest release for {repo}"
+                f"No asset containing '{asset_name_filter}' found in the latest release for {repo}"
             )
-            return None
-        # If no filter/name provided, try to find a zip or 7z
         else:
-            for asset in assets:
-                asset_name = asset.get("name", "")
-                if asset_name.endswith(".zip") or asset_name.endswith(".7z"):
-                    logging.info(
-                        f"Found generic archive asset '{asset_name}' for {repo}"
-                    )
-                    return asset.get("browser_download_url")
             logging.error(
                 f"No suitable archive (.zip or .7z) found in the latest release for {repo}"
             )
-            return None
+        return None
 
     except requests.exceptions.RequestException as e:
         logging.error(f"Error fetching release info for {repo}: {e}")
         return None
-    except Exception as e:
-        logging.error(
-            f"An unexpected error occurred while fetching release info for {repo}: {e}"
-        )
-        return None
 
 
-def download_file(url: str, dest_folder: Path, filename: str | None = None):
-    """Downloads a file from a URL to a destination folder."""
+def _is_download_current(url: str, dest_path: Path, etag_path: Path) -> bool:
+    """Checks with a HEAD request whether dest_path still matches the file at url."""
+    if not dest_path.exists() or not etag_path.exists():
+        return False
+    try:
+        response = SESSION.head(url, allow_redirects=True, timeout=10)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logging.warning(f"Could not check {url} for changes: {e}")
+        return False
+    etag = response.headers.get("ETag")
+    size = int(response.headers.get("content-length", -1))
+    return (
+        etag is not None
+        and etag == etag_path.read_text()
+        and size == dest_path.stat().st_size
+    )
+
+
+def _preallocate(f, size: int):
+    """Reserves size bytes for an open file so it is not grown chunk by chunk."""
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            # On Windows this sets the end of file, which allocates the extent
+            f.truncate(size)
+    except OSError as e:
+        logging.debug(f"Could not preallocate {size} bytes: {e}")
+
+
+def download_file(
+    url: str,
+    dest_folder: Path,
+    filename: str | None = None,
+    show_progress: bool = True,
+):
+    """Downloads url into dest_folder, skipping it if the ETag is unchanged."""
     dest_folder.mkdir(parents=True, exist_ok=True)
     if not filename:
         filename = Path(url).name
     dest_path = dest_folder / filename
+    etag_path = dest_path.with_name(f"{filename}.etag")
+    if _is_download_current(url, dest_path, etag_path):
+        logging.info(f"{filename} already downloaded and unchanged. Skipping download.")
+        return dest_path
+
+    _unlink_if_exists(etag_path)  # Only written back once the download completes
+    # A redrawn progress bar only makes sense on a terminal, not in CI logs
+    show_progress = show_progress and sys.stdout.isatty()
     logging.info(f"Downloading {filename} from {url}...")
-    with requests.get(url, stream=True, timeout=60) as r:
-        r.raise_for_status()
-        total_size = int(r.headers.get("content-length", 0))
-        block_size = 8192  # 8KB
-        bytes_downloaded = 0
-        with open(dest_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=block_size):
-                f.write(chunk)
-                bytes_downloaded += len(chunk)
-                # Basic progress indication
-                progress = int(50 * bytes_downloaded / total_size) if total_size else 0
-                sys.stdout.write(
-                    f"\r[{'=' * progress}{' ' * (50 - progress)}] {bytes_downloaded / (1024 * 1024):.2f} MB / {total_size / (1024 * 1024):.2f} MB"
-                )
-                sys.stdout.flush()
-    sys.stdout.write("\n")  # New line after progress bar
+    progress_drawn = False
+    try:
+        with SESSION.get(url, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            etag = r.headers.get("ETag")
+            total_size = int(r.headers.get("content-length", 0))
+            total_mb = total_size / (1024 * 1024)
+            block_size = DOWNLOAD_CHUNK_SIZE
+            progress_interval = 0.25  # seconds between progress bar redraws
+            last_report = 0.0
+            bytes_downloaded = 0
+            with open(dest_path, "wb") as f:
+                if total_size:
+                    _preallocate(f, total_size)
+                for chunk in r.iter_content(chunk_size=block_size):
+                    f.write(chunk)
+                    bytes_downloaded += len(chunk)
+                    if not show_progress:
+                        continue
+                    now = time.monotonic()
+                    if (
+                        now - last_report < progress_interval
+                        and bytes_downloaded != total_size
+                    ):
+                        continue
+                    last_report = now
+                    # Basic progress indication
+                    progress = (
+                        int(50 * bytes_downloaded / total_size) if total_size else 0
+                    )
+                    sys.stdout.write(
+                        f"\r[{'=' * progress}{' ' * (50 - progress)}] {bytes_downloaded / (1024 * 1024):.2f} MB / {total_mb:.2f} MB"
+                    )
+                    sys.stdout.flush()
+                    progress_drawn = True
+                if bytes_downloaded != total_size:
+                    f.truncate()  # Drop any preallocated space that was not written
+    finally:
+        if progress_drawn:
+            # End the bar's line, also when the download fails halfway
+            sys.stdout.write("\n")
+    if etag:
+        etag_path.write_text(etag)
     logging.info(f"Successfully downloaded {dest_path}")
     return dest_path
 
 
-def extract_archive(archive_path: Path, extract_to_folder: Path):
-    """Extracts a .zip or .7z archive."""
+def _extract_zip_member(
+    zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, extract_to_folder: Path
+):
+    """Streams a zip entry into the resolved extract_to_folder with a 1 MiB buffer."""
+    target = (extract_to_folder / info.filename).resolve()
+    if not target.is_relative_to(extract_to_folder):
+        logging.warning(f"Skipping zip entry outside of target: {info.filename}")
+        return
+    if info.is_dir():
+        target.mkdir(parents=True, exist_ok=True)
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zip_ref.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+
+
+def _extract_zip_parallel(
+    archive_path: Path, infos: List[zipfile.ZipInfo], extract_to_folder: Path
+):
+    """Extracts zip entries on a thread pool, with one ZipFile handle per worker."""
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+
+    def extract(info: zipfile.ZipInfo):
+        if not hasattr(local, "zip_ref"):
+            local.zip_ref = zipfile.ZipFile(archive_path, "r")
+            handles.append(local.zip_ref)
+        _extract_zip_member(local.zip_ref, info, extract_to_folder)
+
+    try:
+        with ThreadPoolExecutor(max_workers=_worker_count(len(infos))) as executor:
+            futures = [executor.submit(extract, info) for info in infos]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def extract_archive(
+    archive_path: Path,
+    extract_to_folder: Path,
+    members: Iterable[str] | None = None,
+):
+    """Extracts a .zip or .7z archive, optionally only entries at or below members."""
+    members = tuple(m.strip("/") for m in members) if members else ()
+    prefixes = tuple(f"{m}/" for m in members)
+
+    def wanted(name: str) -> bool:
+        # Zip directory entries carry a trailing slash, 7z names never do
+        return not members or name.rstrip("/") in members or name.startswith(prefixes)
+
     if not archive_path or not archive_path.exists():
         logging.error(f"Archive path does not exist: {archive_path}")
         return False
@@ -131,24 +351,31 @@ def extract_archive(archive_path: Path, extract_to_folder: Path):
     logging.info(f"Extracting {archive_path.name} to {extract_to_folder}...")
     try:
         if archive_path.suffix == ".zip":
+            # Resolved once here, members are checked against it for path traversal
+            extract_to_folder = extract_to_folder.resolve()
             with zipfile.ZipFile(archive_path, "r") as zip_ref:
-                zip_ref.extractall(extract_to_folder)
+                infos = [i for i in zip_ref.infolist() if wanted(i.filename)]
+                if members and not infos:
+                    logging.error(f"None of {members} found in {archive_path}")
+                    return False
+                # Create directories upfront so workers only write files
+                for info in infos:
+                    if info.is_dir():
+                        _extract_zip_member(zip_ref, info, extract_to_folder)
+                files = [info for info in infos if not info.is_dir()]
+                _extract_zip_parallel(archive_path, files, extract_to_folder)
             logging.info("Successfully extracted zip archive.")
             return True
         elif archive_path.suffix == ".7z":
-            # Use 7zr to extract .7z files
-            sevenzr_path = Path(DOWNLOAD_DIR) / "7zr.exe"
-            if not sevenzr_path.exists():
-                logging.error("7zr.exe not found. Cannot extract .7z files.")
-                return False
-            command = [
-                str(sevenzr_path),
-                "x",
-                str(archive_path),
-                f"-o{str(extract_to_folder)}",
-                "-aoa",
-            ]
-            run_process(command)
+            with py7zr.SevenZipFile(archive_path, mode="r") as archive:
+                if members:
+                    targets = [name for name in archive.getnames() if wanted(name)]
+                    if not targets:
+                        logging.error(f"None of {members} found in {archive_path}")
+                        return False
+                    archive.extract(path=extract_to_folder, targets=targets)
+                else:
+                    archive.extractall(path=extract_to_folder)
             logging.info("Successfully extracted 7z archive.")
             return True
         else:
@@ -157,28 +384,71 @@ def extract_archive(archive_path: Path, extract_to_folder: Path):
     except zipfile.BadZipFile:
         logging.error(f"Error: Bad Zip file: {archive_path}")
         return False
+    except py7zr.exceptions.UnsupportedCompressionMethodError as e:
+        # e.g. the BCJ2 filter 7-Zip applies to executables at ultra level
+        logging.error(
+            f"{archive_path.name} uses a compression method py7zr cannot extract: {e.message}"
+        )
+        return False
 
     except Exception as e:
         logging.error(f"Failed to extract {archive_path}: {e}")
         return False
 
 
-def find_and_get_appid(search_path: Path) -> str:
-    """Finds steam_appid.txt or prompts user for AppID."""
+def extract_if_needed(
+    archive_path: Path,
+    extract_to_folder: Path,
+    members: Iterable[str] | None = None,
+) -> bool:
+    """Extracts an archive unless a marker shows it was already extracted there."""
+    if not archive_path or not archive_path.exists():
+        logging.error(f"Archive path does not exist: {archive_path}")
+        return False
+    with open(archive_path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    for member in sorted(members or ()):
+        digest.update(f"\0{member}".encode())
+    marker = extract_to_folder / f".extracted.{digest.hexdigest()}"
+    if marker.exists():
+        logging.info(f"{archive_path.name} already extracted to {extract_to_folder}")
+        return True
+
+    if extract_to_folder.exists():
+        for old_marker in extract_to_folder.glob(".extracted.*"):
+            _unlink_if_exists(old_marker)
+    if not extract_archive(archive_path, extract_to_folder, members):
+        return False
+    marker.touch()
+    return True
+
+
+def download_and_extract(
+    url: str,
+    extract_to_folder: Path,
+    members: Iterable[str] | None = None,
+    show_progress: bool = True,
+) -> bool:
+    """Downloads an archive to DOWNLOAD_DIR and extracts it."""
+    try:
+        archive_path = download_file(url, DOWNLOAD_DIR, show_progress=show_progress)
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Failed to download {url}: {e}")
+        return False
+    return extract_if_needed(archive_path, extract_to_folder, members)
 
-    app_id_file = None
-    for path in search_path.rglob("steam_appid.txt"):
-        if path.is_file():
-            app_id_file = path
-            break
 
-    if app_id_file and app_id_file.is_file():
+def find_and_get_appid(app_id_files: List[Path]) -> str:
+    """Reads the AppID from the first found steam_appid.txt or prompts user for it."""
+
+    app_id_file = app_id_files[0] if app_id_files else None
+    if app_id_file:
         logging.info(f"Found {app_id_file}")
         try:
             with open(app_id_file, "r") as f:
                 appid = f.read().strip()
-            if appid.isdigit():
-                logging.info(f"Read AppID: {appid} from file {search_path}.")
+            if _APPID_RE.fullmatch(appid):
+                logging.info(f"Read AppID: {appid} from file {app_id_file}.")
                 return appid
             else:
                 logging.warning(
@@ -190,25 +460,140 @@ def find_and_get_appid(search_path: Path) -> str:
     logging.info("Could not find steam_appid.txt")
     while True:
         appid = input("Please enter the Steam AppID: ").strip()
-        if not appid.isdigit():
+        if not _APPID_RE.fullmatch(appid):
             logging.warning(f"Invalid AppID entered: {appid}. Please try again.")
             continue
         return appid
 
 
-def copy_contents(src_dir: Path, dest_dir: Path):
-    """Copies contents of src_dir to dest_dir, overwriting existing files/dirs."""
+def scan_game_tree(
+    root: Path, filenames: Iterable[str] = ("steam_api64.dll", "steam_appid.txt")
+) -> Tuple[List[Path], Dict[str, List[Path]]]:
+    """Collects .exe files and files named in filenames under root in a single scan."""
+    exe_list: List[Path] = []
+    found: Dict[str, List[Path]] = {name.lower(): [] for name in filenames}
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue  # Unreadable directory, skipped like os.walk does
+        with entries:
+            for entry in entries:
+                # DirEntry caches the type from the directory listing, no stat
+                if entry.is_dir(follow_symlinks=False):
+                    if not _SKIP_DIR_RE.search(entry.name):
+                        stack.append(entry.path)
+                    continue
+                lower_name = entry.name.lower()
+                if lower_name.endswith(".exe"):
+                    exe_list.append(Path(entry.path))
+                elif lower_name in found:
+                    found[lower_name].append(Path(entry.path))
+    return exe_list, found
+
+
+def _unlink_if_exists(path: Path | str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int):
+    while os.copy_file_range(src_fd, dst_fd, size):
+        pass
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int):
+    offset = 0
+    while sent := os.sendfile(dst_fd, src_fd, offset, size):
+        offset += sent
+
+
+def fastcopy(src: Path | str, dst: Path | str) -> Path | str:
+    """Copies the contents of file src to dst, overwriting dst."""
+    _unlink_if_exists(dst)  # Rather than truncating, so hardlinks to dst keep data
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = max(os.fstat(src_fd).st_size, COPY_BUFSIZE)
+        for name, zero_copy in (
+            ("copy_file_range", _copy_file_range),
+            ("sendfile", _sendfile),
+        ):
+            if not hasattr(os, name):
+                continue
+            try:
+                zero_copy(src_fd, dst_fd, size)
+                return dst
+            except OSError:
+                # Unsupported for these files, start over with the next method
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+
+        buffer = memoryview(bytearray(COPY_BUFSIZE))
+        while n := fsrc.readinto(buffer):
+            fdst.write(buffer[:n])
+    return dst
+
+
+def _copy_with_stat(src: Path | str, dst: Path | str) -> Path | str:
+    """fastcopy that also keeps the mtime and permissions, like shutil.copy2."""
+    fastcopy(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def link_or_copy(src: Path | str, dst: Path | str) -> Path | str:
+    """Hardlinks dst to src, replacing dst, or copies if linking is unsupported."""
+    _unlink_if_exists(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # e.g. different volumes or no hardlink support
+        _copy_with_stat(src, dst)
+    return dst
+
+
+def copy_contents(src_dir: Path, dest_dirs: List[Path]):
+    """Copies contents of src_dir into every dest_dir, overwriting existing files."""
     if not src_dir.is_dir():
         logging.error(f"Source directory for copy does not exist: {src_dir}")
         return False
-    if not dest_dir.is_dir():
-        logging.error(f"Destination directory for copy does not exist: {dest_dir}")
-        return False
+    for dest_dir in dest_dirs:
+        if not dest_dir.is_dir():
+            logging.error(f"Destination directory for copy does not exist: {dest_dir}")
+            return False
+    if not dest_dirs:
+        return True
 
-    logging.info(f"Copying contents from {src_dir} to {dest_dir} (overwriting)...")
+    # Like copytree, symlinked directories are copied as regular directories
+    subdirs = []
+    files = []
+    for dirpath, _, filenames in os.walk(src_dir, followlinks=True):
+        subdir = Path(dirpath).relative_to(src_dir)
+        subdirs.append(subdir)
+        files.extend(subdir / name for name in filenames)
+
+    def copy_to(dest_dir: Path, source_dir: Path, copy_function):
+        logging.info(f"Copying contents from {src_dir} to {dest_dir} (overwriting)...")
+        for subdir in subdirs:
+            (dest_dir / subdir).mkdir(parents=True, exist_ok=True)
+        for file in files:
+            copy_function(source_dir / file, dest_dir / file)
+
+    first_dir, *other_dirs = dest_dirs
     try:
-        # dirs_exist_ok=True prevents error if subdirs already exist
-        shutil.copytree(src_dir, dest_dir, dirs_exist_ok=True)
+        copy_to(first_dir, src_dir, _copy_with_stat)
+        with ThreadPoolExecutor(max_workers=_worker_count(len(other_dirs))) as executor:
+            list(
+                executor.map(
+                    lambda dest_dir: copy_to(dest_dir, first_dir, link_or_copy),
+                    other_dirs,
+                )
+            )
         logging.info("Successfully copied contents.")
         return True
     except Exception as e:
@@ -245,20 +630,10 @@ def get_steamless():
         # For now, let's just continue without it.
         return
 
-    logging.info(f"Downloading Steamless from {steamless_url}...")
-
-    # Check if already downloaded
-    steamless_archive = DOWNLOAD_DIR / Path(steamless_url).name
-    if steamless_archive.exists():
-        logging.info(
-            f"Latest Steamless release already downloaded: {steamless_archive.name}. Skipping download."
-        )
-    else:
-        # Download if not already present
-        steamless_archive = download_file(steamless_url, DOWNLOAD_DIR)
     steamless_extract_path = TOOLS_DIR / "steamless"
-    if not steamless_archive or not extract_archive(
-        steamless_archive, steamless_extract_path
+    # Fetched alongside the emulator, whose progress bar is the one drawn
+    if not download_and_extract(
+        steamless_url, steamless_extract_path, show_progress=False
     ):
         logging.warning(
             "Failed to download or extract Steamless. Continuing without it."
@@ -273,19 +648,17 @@ def get_emu():
     if not emu_url:
         logging.error("Failed to find GBE Fork Emulator release. Exiting.")
         sys.exit(1)
-    emu_archive = download_file(emu_url, DOWNLOAD_DIR)
     emu_extract_path = TOOLS_DIR / "gbe_fork_emu"
-    if not emu_archive or not extract_archive(emu_archive, emu_extract_path):
+    if not download_and_extract(emu_url, emu_extract_path, EMU_ARCHIVE_MEMBERS):
         logging.error("Failed to download or extract GBE Fork Emulator. Exiting.")
         sys.exit(1)
-    emu_dll_dir = emu_extract_path / "release" / "experimental" / "x64"
 
-    if not emu_dll_dir.exists():
+    if not EMU_PATH.exists():
         logging.error(
-            f"Could not find {emu_dll_dir} folder in extracted GBE Fork Emulator."
+            f"Could not find {EMU_PATH} folder in extracted GBE Fork Emulator."
         )
         sys.exit(1)
-    return emu_dll_dir
+    return EMU_PATH
 
 
 def get_emu_tools():
@@ -295,53 +668,50 @@ def get_emu_tools():
     if not tools_url:
         logging.error("Failed to find GBE Fork Tools release. Exiting.")
         sys.exit(1)
-    tools_archive = DOWNLOAD_DIR / Path(tools_url).name
-
-    if not tools_archive.exists():
-        tools_archive = download_file(tools_url, DOWNLOAD_DIR)
-    else:
-        logging.info(
-            f"Latest release already downloaded: {tools_archive.name}. Skipping download."
-        )
-    if not extract_archive(tools_archive, EMU_TOOLS_PATH):
-        logging.error("Failed to extract GBE Fork Tools. Exiting.")
+    if not download_and_extract(
+        tools_url, EMU_TOOLS_PATH, EMU_TOOLS_ARCHIVE_MEMBERS, show_progress=False
+    ):
+        logging.error("Failed to download or extract GBE Fork Tools. Exiting.")
         sys.exit(1)
     if not CONFIG_EMU_EXE.exists():
         logging.error(f"Generator executable not found at {CONFIG_EMU_EXE}. Exiting.")
         sys.exit(1)
 
 
-def get_7zr():
-    if SEVENZR_EXE.exists():
-        logging.info(f"7zr.exe already exists at {SEVENZR_EXE}. Skipping download.")
-        return
-    logging.info("7zr.exe not found. Downloading...")
-    if not download_file(SEVENZR_URL, DOWNLOAD_DIR):
-        logging.error("Failed to download 7zr.exe. Exiting.")
-        sys.exit(1)
-
-
 def run_process(
     command: List[str],
     print_errors: bool = True,
     show_output: bool = False,
+    cwd: Path | None = None,
 ):
     logging.info(f"Running: {' '.join(command)}")
     exception = None
+    # Output that would never be printed is dropped by the OS instead of
+    # being buffered in memory
+    if show_output:
+        stdout = stderr = None
+    elif print_errors:
+        stdout = stderr = subprocess.PIPE
+    else:
+        stdout = stderr = subprocess.DEVNULL
     try:
         subprocess.run(
             command,
-            stdout=None if show_output else subprocess.PIPE,
+            stdout=stdout,
+            stderr=stderr,
             check=True,
+            cwd=cwd,
         )
     except subprocess.CalledProcessError as e:
         exception = e
         if print_errors:
             logging.error(f"Command failed with return code {e.returncode}.")
             if e.stdout:
-                logging.error(f"Output:\n{bytes(e.stdout).decode('utf-8')}")
+                logging.error(f"Output:\n{e.stdout.decode('utf-8', errors='replace')}")
             if e.stderr:
-                logging.error(f"Error Output:\n{bytes(e.stderr).decode('utf-8')}")
+                logging.error(
+                    f"Error Output:\n{e.stderr.decode('utf-8', errors='replace')}"
+                )
     except Exception as e:
         exception = e
         if print_errors:
@@ -353,19 +723,64 @@ def run_process(
         raise exception
 
 
+def _worker_count(tasks: int) -> int:
+    """Returns a thread pool size for tasks independent subprocess jobs."""
+    return max(1, min(os.cpu_count() or 1, tasks))
+
+
+def _decrypt_one(exe: Path, steamless_cli: Path) -> bool:
+    """Unpacks a single .exe with Steamless and replaces it, keeping a backup."""
+    try:
+        run_process([str(steamless_cli), "--quiet", str(exe)], False)
+    except Exception:
+        return False
+    logging.info(f"Decrypted {exe.name} successfully, replacing...")
+    # The backup may be a hardlink, so exe is replaced rather than rewritten
+    link_or_copy(exe, exe.with_suffix(".exe.bak"))
+    os.replace(exe.with_suffix(".exe.unpacked.exe"), exe)
+    return True
+
+
+def _process_one_dll(steam_dll: Path) -> bool:
+    """Generates steam_interfaces.txt for steam_dll, returning whether it succeeded."""
+    # Each run gets its own working directory, as generate_interfaces always
+    # writes steam_interfaces.txt to the current directory.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        command = [str(INTERFACES_EMU_EXE.resolve()), str(steam_dll.resolve())]
+        try:
+            run_process(command, print_errors=False, cwd=Path(tmpdir))
+        except Exception:
+            logging.error(f"Failed to generate interfaces for {steam_dll}")
+            return False
+
+        steam_settings = steam_dll.parent / "steam_settings"
+        steam_settings.mkdir(exist_ok=True)
+        fastcopy(
+            Path(tmpdir) / "steam_interfaces.txt",
+            steam_settings / "steam_interfaces.txt",
+        )
+    return True
+
+
 def overwrite_dll(game_path: Path) -> None:
+    logging.info("--- Scanning game directory ---")
+    exe_list, found = scan_game_tree(game_path)
+    steam_dlls = found["steam_api64.dll"]
+
     logging.info("--- Determining Steam AppID ---")
-    app_id = find_and_get_appid(game_path)
+    app_id = find_and_get_appid(found["steam_appid.txt"])
 
     # --- Ensure working directories exist ---
     DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
     TOOLS_DIR.mkdir(parents=True, exist_ok=True)
 
     # --- Download and setup Tools ---
-    get_7zr()  # aka 7zip cli
-    get_emu_tools()
-    get_emu()
-    get_steamless()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        emu_future = executor.submit(get_emu)
+        futures = [executor.submit(fn) for fn in (get_emu_tools, get_steamless)]
+        for future in futures:
+            future.result()
+        emu_dll_dir = emu_future.result()
 
     # Decrypt .exe files with steamless
     logging.info("--- Decrypting .exe files with Steamless ---")
@@ -374,41 +789,24 @@ def overwrite_dll(game_path: Path) -> None:
         logging.error("steamless.cli.exe not found. Exiting.")
         sys.exit(1)
 
-    exe_list: List[Path] = []
-    for steam_dll in game_path.rglob("*.exe"):
-        if steam_dll.is_file():
-            exe_list.append(steam_dll)
-
     if not exe_list or len(exe_list) == 0:
         logging.error("No .exe files found in the game directory. Exiting.")
         sys.exit(1)
 
     logging.info("Trying to decrypt files")
-    for exe in exe_list:
-        try:
-            run_process([str(steamless_cli), "--quiet", str(exe)], False)
-            logging.info(f"{exe} decrypted successfully.")
-        except Exception:
-            pass
-        else:
-            logging.info(f"Decrypted {exe.name} successfully, replacing...")
-            shutil.copyfile(exe, exe.with_suffix(".exe.bak"))
-            shutil.move(exe.with_suffix(".exe.unpacked.exe"), exe)
+    with ThreadPoolExecutor(max_workers=_worker_count(len(exe_list))) as executor:
+        decrypted = sum(
+            executor.map(lambda exe: _decrypt_one(exe, steamless_cli), exe_list)
+        )
+    logging.info(f"Decrypted {decrypted} of {len(exe_list)} .exe files")
 
     # --- Find steam_api64.dll ---
     logging.info("--- Locating steam_api64.dll ---")
-    steam_dlls: List[Path] = []
-    for steam_dll in game_path.rglob("steam_api64.dll"):
-        # Check if path contains word crack or original
-        if "crack" in str(steam_dll).lower() or "original" in str(steam_dll).lower():
-            logging.info(f"Skipping {steam_dll} as it is a crack or original version.")
-            continue
-        if steam_dll.is_file():
-            logging.info(f"Found steam_api64.dll at {steam_dll}")
-            steam_dlls.append(steam_dll)
-            shutil.copy(
-                steam_dll, steam_dll.with_suffix(".dll.bak")
-            )  # Rename original dll
+    for steam_dll in steam_dlls:
+        logging.info(f"Found steam_api64.dll at {steam_dll}")
+        link_or_copy(
+            steam_dll, steam_dll.with_suffix(".dll.bak")
+        )  # Back up original dll
     if not steam_dlls:
         logging.error("steam_api64.dll not found in src directory. Exiting.")
         sys.exit(1)
@@ -418,33 +816,22 @@ def overwrite_dll(game_path: Path) -> None:
     command = [str(CONFIG_EMU_EXE), "-cve", "-token", app_id]
     run_process(command, show_output=True)
 
-    # --- Copy Generator Output ---
-    logging.info("--- Copying Emulator Config Files ---")
-    for steam_dll in steam_dlls:
-        shutil.copytree(
-            Path("output") / app_id,
-            steam_dll.parent,
-            dirs_exist_ok=True,
-        )
-
-    # --- Generate interfaces ---
-    logging.info("--- Generating Interfaces ---")
-    for steam_dll in steam_dlls:
-        command = [str(INTERFACES_EMU_EXE), str(steam_dll)]
-        try:
-            run_process(command, print_errors=False)
-        except Exception:
-            logging.error(f"Failed to generate interfaces for {steam_dll}")
-            continue
-
-        shutil.copyfile(
-            "steam_interfaces.txt",
-            steam_dll.parent / "steam_settings",
-        )
-        # --- Copy Experimental Files ---
-        logging.info("--- Copying Interfaces ---")
-        if not copy_contents(EMU_PATH, steam_dll.parent):
-            logging.error("Failed to copy files. Exiting.")
-            sys.exit(1)
+    # --- Copy config, generate interfaces and copy emulator files ---
+    logging.info("--- Applying Emulator to steam_api64.dll locations ---")
+    # The config is walked and copied once, the other locations get hardlinks
+    config_dir = Path("output") / app_id
+    if not copy_contents(config_dir, [dll.parent for dll in steam_dlls]):
+        logging.error("Failed to copy emulator config. Exiting.")
+        sys.exit(1)
+    with ThreadPoolExecutor(max_workers=_worker_count(len(steam_dlls))) as executor:
+        results = list(executor.map(_process_one_dll, steam_dlls))
+
+    # --- Copy Experimental Files ---
+    # Only after all interfaces are generated, as this replaces the original dlls
+    logging.info("--- Copying Emulator Files ---")
+    emu_dirs = [dll.parent for dll, ok in zip(steam_dlls, results) if ok]
+    if not copy_contents(emu_dll_dir, emu_dirs):
+        logging.error("Failed to copy files. Exiting.")
+        sys.exit(1)
 
     logging.info("--- Script finished successfully! ---")
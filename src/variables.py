@@ -1,20 +1,34 @@
 # --- Configuration ---
+import os
 from pathlib import Path
 
 GITHUB_API_BASE = "https://api.github.com/repos"
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+RATE_LIMIT_MIN_REMAINING = 5  # wait for the reset below this many API calls
+RATE_LIMIT_MAX_WAIT = 60  # seconds, longer resets are not waited for
 TOOLS_REPO = "Detanup01/gbe_fork_tools"
 EMU_REPO = "Detanup01/gbe_fork"
 STEAMLESS_REPO = "atom0s/Steamless"
-SEVENZR_URL = "https://www.7-zip.org/a/7zr.exe"
+
+ARCHIVE_SUFFIXES = (".zip", ".7z")
+
+COPY_BUFSIZE = 1024 * 1024  # 1 MiB
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
 
 DOWNLOAD_DIR = Path("./tools/downloads")
 TOOLS_DIR = Path("./tools")
+CACHE_DIR = TOOLS_DIR / ".cache"
+
+RELEASE_CACHE_TTL = 15 * 60  # seconds, after that the ETag is revalidated
 
 EMU_TOOLS_PATH = TOOLS_DIR / "gbe_fork_tools"
 EMU_PATH = TOOLS_DIR / "gbe_fork_emu" / "release" / "experimental" / "x64"
 STEAMLESS_PATH = TOOLS_DIR / "steamless"
 
-SEVENZR_EXE = DOWNLOAD_DIR / "7zr.exe"
+# Archive entries actually used, everything else is skipped on extraction
+EMU_ARCHIVE_MEMBERS = ("release/experimental/x64", "release/tools/generate_interfaces")
+EMU_TOOLS_ARCHIVE_MEMBERS = ("generate_emu_config",)
+
 CONFIG_EMU_EXE = EMU_TOOLS_PATH / "generate_emu_config" / "generate_emu_config.exe"
 # tools\gbe_fork_emu\release\tools\generate_interfaces\generate_interfaces_x64.exe
 INTERFACES_EMU_EXE = (